@@ -72,17 +72,23 @@ class TestProcess(unittest.TestCase):
 
     # --------------------------------------------------------------------------
     #
+    @unittest.mock.patch('rc.process.process._Reactor.get')
     @unittest.mock.patch('subprocess.Popen')
-    def test_start(self, mock_popen):
+    def test_start(self, mock_popen, mock_reactor_get):
         """
-        Test start() to ensure a background thread is spawned and
-        subprocess.Popen is invoked with correct parameters.
+        Test start() to ensure the process is handed to the shared reactor
+        and subprocess.Popen is invoked with correct parameters.
         """
         # Mock the Popen object itself:
         mock_proc = unittest.mock.MagicMock()
         mock_proc.poll.return_value = None  # Pretend it's running
         mock_popen.return_value = mock_proc
 
+        # Stub the shared reactor: the mocked Popen's fake fds must never
+        # reach the real selector (MagicMock.fileno() would index to fd 1)
+        mock_reactor = unittest.mock.MagicMock()
+        mock_reactor_get.return_value = mock_reactor
+
         # Start the process
         self.proc.start()
 
@@ -90,9 +96,12 @@ class TestProcess(unittest.TestCase):
         mock_popen.assert_called_once()
         self.assertEqual(self.proc.state, Process.RUNNING)
 
-        # Ensure the background thread has set self._proc
+        # Ensure start() has set self._proc synchronously
         self.assertIsNotNone(self.proc._proc)
 
+        # Verify the process was registered with the shared reactor
+        mock_reactor.add.assert_called_once_with(self.proc)
+
 
     # --------------------------------------------------------------------------
     #
@@ -126,7 +135,8 @@ class TestProcess(unittest.TestCase):
         proc = Process(cmd='sleep 2', shell=True)
         proc.start()
 
-        time.sleep(0.1)  # Give it a moment to start
+        # block on the started event instead of a fixed wall-clock delay
+        self.assertTrue(proc._started.wait(timeout=1.0))
 
         # Cancel the process
         proc.cancel()
@@ -217,6 +227,24 @@ class TestProcess(unittest.TestCase):
         self.assertIsNone(proc_no_stderr.stderr)
 
 
+    # --------------------------------------------------------------------------
+    #
+    def test_shared_reactor(self):
+        """
+        Test that concurrently running processes share a single reactor
+        instead of spawning one IO thread per process.
+        """
+        procs = [Process(cmd='sleep 0.1', shell=True) for _ in range(5)]
+        for proc in procs:
+            proc.start()
+
+        self.assertEqual(len({id(proc._reactor) for proc in procs}), 1)
+
+        for proc in procs:
+            self.assertEqual(proc.wait(timeout=5.0), 0)
+            self.assertEqual(proc.state, Process.DONE)
+
+
     # --------------------------------------------------------------------------
     #
     def test_bufsize_property(self):
@@ -248,6 +276,7 @@ if __name__ == '__main__':
     tc.test_handle_io_chunk_cb()
     tc.test_handle_io_line_cb()
     tc.test_stdout_stderr_properties()
+    tc.test_shared_reactor()
     tc.test_bufsize_property()
     tc.test_polldelay_property()
     tc.tearDown()